@@ -770,3 +770,23 @@ class TestTransientNutationFFT(unittest.TestCase):
         analysis = self.dataset.analyse(self.analysis)
 
         self.assertEqual(2, analysis.result.data.data.ndim)
+
+    def test_with_2D_dataset_applies_window_to_all_rows(self):
+        self.create_time_trace()
+        self.analysis.parameters["window"] = "hann"
+        result_1d = self.dataset.analyse(self.analysis).result.data.data
+        time_values = self.dataset.data.axes[0].values
+        self.dataset.data.data = np.vstack(
+            (self.dataset.data.data, self.dataset.data.data)
+        )
+        self.dataset.data.axes[0].values = [345.0, 346.0]
+        self.dataset.data.axes[0].quantity = "magnetic field"
+        self.dataset.data.axes[0].unit = "mT"
+        self.dataset.data.axes[1].values = time_values
+        self.dataset.data.axes[1].quantity = "time"
+        self.dataset.data.axes[1].unit = "s"
+
+        analysis = self.dataset.analyse(self.analysis)
+
+        np.testing.assert_allclose(analysis.result.data.data[0], result_1d)
+        np.testing.assert_allclose(analysis.result.data.data[1], result_1d)
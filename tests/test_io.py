@@ -70,6 +70,17 @@ class TestDatasetImporterFactory(unittest.TestCase):
         self.assertIsInstance(importer, trepr.io.BES3TImporter)
 
 
+class TestReadPackageYaml(unittest.TestCase):
+    def test_returns_dict(self):
+        contents = trepr.io._read_package_yaml("trepr@tez_mapper.yaml")
+        self.assertIsInstance(contents, dict)
+
+    def test_parses_file_only_once(self):
+        first = trepr.io._read_package_yaml("trepr@bes3t_dsc_keys.yaml")
+        second = trepr.io._read_package_yaml("trepr@bes3t_dsc_keys.yaml")
+        self.assertIs(first, second)
+
+
 class TestSpeksimImporter(unittest.TestCase):
     def setUp(self):
         self.source = os.path.join(ROOTPATH, "testdata", "speksim")
@@ -136,6 +147,41 @@ class TestTezImporter(unittest.TestCase):
         self.dataset.import_from(self.importer)
         self.assertEqual(3, len(self.importer.dataset.data.axes))
 
+    def test_2D_data_with_field_as_first_axis_are_c_contiguous(self):
+        dsc_contents = [
+            "#DESC	1.2 * DESCRIPTOR INFORMATION ***********************",
+            "*",
+            "BSEQ	BIG",
+            "IKKF	REAL",
+            "XTYP	IDX",
+            "YTYP	IDX",
+            "IRFMT	D",
+            "XPTS	4",
+            "XMIN	3400.000000",
+            "XWID	30.000000",
+            "YPTS	3",
+            "YMIN	0.000000",
+            "YWID	20.000000",
+            "XNAM	'Field'",
+            "YNAM	'Time'",
+            "XUNI	'G'",
+            "YUNI	'ns'",
+            "IRNAM	'Intensity'",
+            "IRUNI	''",
+            "TITL	'Pentacen transient'",
+        ]
+        self.prepare_dsc_file(contents=dsc_contents)
+        data = np.arange(12.0)
+        with open(self.datafile, "wb") as file:
+            for value in data:
+                file.write(struct.pack(">d", value))
+        self.importer.source = self.descriptionfile
+        self.dataset.import_from(self.importer)
+        self.assertTrue(self.dataset.data.data.flags.c_contiguous)
+        np.testing.assert_array_equal(
+            data.reshape(3, 4).T, self.dataset.data.data
+        )
+
     def test_data_shape_matches_axes_lengths(self):
         """Crucial test for dimensions!
         0: magnetic field axis
@@ -683,6 +729,41 @@ class TestBES3TImporter(unittest.TestCase):
     def test_importer(self):
         self.dataset.import_from(self.importer)
 
+    def test_2D_data_with_field_as_first_axis_are_c_contiguous(self):
+        dsc_contents = [
+            "#DESC	1.2 * DESCRIPTOR INFORMATION ***********************",
+            "*",
+            "BSEQ	BIG",
+            "IKKF	REAL",
+            "XTYP	IDX",
+            "YTYP	IDX",
+            "IRFMT	D",
+            "XPTS	4",
+            "XMIN	3400.000000",
+            "XWID	30.000000",
+            "YPTS	3",
+            "YMIN	0.000000",
+            "YWID	20.000000",
+            "XNAM	'Field'",
+            "YNAM	'Time'",
+            "XUNI	'G'",
+            "YUNI	'ns'",
+            "IRNAM	'Intensity'",
+            "IRUNI	''",
+            "TITL	'Pentacen transient'",
+        ]
+        self.prepare_dsc_file(contents=dsc_contents)
+        data = np.arange(12.0)
+        with open(self.datafile, "wb") as file:
+            for value in data:
+                file.write(struct.pack(">d", value))
+        self.importer.source = self.descriptionfile
+        self.dataset.import_from(self.importer)
+        self.assertTrue(self.dataset.data.data.flags.c_contiguous)
+        np.testing.assert_array_equal(
+            data.reshape(3, 4).T, self.dataset.data.data
+        )
+
     def test_with_minimal_1D_file(self):
         dsc_contents = [
             "#DESC	1.2 * DESCRIPTOR INFORMATION ***********************",
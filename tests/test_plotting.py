@@ -7,6 +7,19 @@ import trepr.dataset
 import trepr.plotting
 
 
+class TestColormapAdjuster(unittest.TestCase):
+
+    def setUp(self):
+        self.dataset = trepr.dataset.ExperimentalDataset()
+        self.dataset.data.data = np.asarray([[-3.0, 1.0], [2.0, 0.5]])
+        self.adjuster = trepr.plotting.ColormapAdjuster(dataset=self.dataset)
+
+    def test_adjust_sets_symmetric_norm_from_largest_absolute_value(self):
+        self.adjuster.adjust()
+        self.assertEqual(-3.0, self.adjuster.normalised_colormap.vmin)
+        self.assertEqual(3.0, self.adjuster.normalised_colormap.vmax)
+
+
 class TestSinglePlotter1D(unittest.TestCase):
 
     def setUp(self):
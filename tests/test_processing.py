@@ -26,6 +26,64 @@ class TestPretriggerOffsetCompensation(unittest.TestCase):
         self.processing._get_zeropoint_index()
         self.assertNotEqual(0, self.processing.parameters["zeropoint_index"])
 
+    def test_processing_with_integer_data(self):
+        self.dataset.data.data = (self.dataset.data.data * 1e3).astype(int)
+        processing_step = self.dataset.process(self.processing)
+        range_end = processing_step.parameters["zeropoint_index"]
+        self.assertTrue(
+            np.issubdtype(self.dataset.data.data.dtype, np.floating)
+        )
+        np.testing.assert_allclose(
+            np.mean(self.dataset.data.data[:, :range_end], axis=1),
+            0,
+            atol=1e-9,
+        )
+
+    def test_processing_with_complex_data_keeps_imaginary_part(self):
+        self.dataset.data.data = self.dataset.data.data * (1 + 2j)
+        processing_step = self.dataset.process(self.processing)
+        range_end = processing_step.parameters["zeropoint_index"]
+        self.assertTrue(
+            np.issubdtype(self.dataset.data.data.dtype, np.complexfloating)
+        )
+        np.testing.assert_allclose(
+            2 * self.dataset.data.data.real,
+            self.dataset.data.data.imag,
+            atol=1e-9,
+        )
+        np.testing.assert_allclose(
+            np.mean(self.dataset.data.data[:, :range_end], axis=1),
+            0,
+            atol=1e-9,
+        )
+
+    def test_removes_individual_offset_of_integer_time_traces(self):
+        dataset = trepr.dataset.ExperimentalDataset()
+        dataset.data.data = np.tile(np.arange(100), (3, 1)) + np.array(
+            [[0], [10], [-20]]
+        )
+        dataset.data.axes[1].values = np.linspace(-1, 4, 100)
+        processing_step = dataset.process(self.processing)
+        range_end = processing_step.parameters["zeropoint_index"]
+        np.testing.assert_allclose(
+            dataset.data.data[0], dataset.data.data[1], atol=1e-12
+        )
+        np.testing.assert_allclose(
+            np.zeros(3),
+            np.mean(dataset.data.data[:, :range_end], axis=1),
+            atol=1e-12,
+        )
+
+    def test_pretrigger_part_averages_to_zero(self):
+        processing_step = self.dataset.process(self.processing)
+        range_end = processing_step.parameters["zeropoint_index"]
+        pretrigger = self.dataset.data.data[:, :range_end]
+        np.testing.assert_allclose(
+            np.zeros(pretrigger.shape[0]),
+            np.mean(pretrigger, axis=1),
+            atol=1e-12,
+        )
+
 
 class TestBackgroundCorrection(unittest.TestCase):
     def setUp(self):
@@ -63,6 +121,14 @@ class TestBackgroundCorrection(unittest.TestCase):
         self.dataset.process(self.processing)
         self.assertGreater(5.0, self.dataset.data.data[16, 0])
 
+    def test_perform_task_with_negative_number_uses_upper_end(self):
+        self.create_dataset()
+        self.dataset.data.data[-10:] += 2
+        self.processing.parameters["num_profiles"] = -10
+        self.dataset.process(self.processing)
+        self.assertAlmostEqual(0, self.dataset.data.data[-1, 0])
+        self.assertAlmostEqual(-2, self.dataset.data.data[0, 0])
+
     def test_perform_task_with_list_two_elements(self):
         self.create_dataset()
         self.dataset.data.data[-10:] += 2
@@ -163,3 +229,10 @@ class TestTriggerAutodetection(unittest.TestCase):
         self.dataset.data.axes[1].quantity = "time"
         self.dataset.process(self.processing)
         self.assertLess(self.dataset.data.axes[1].values[0], 0)
+
+    def test_boxcar_sum_equals_full_convolution(self):
+        values = np.random.random(100)
+        np.testing.assert_allclose(
+            np.convolve(values, np.ones(7)),
+            self.processing._boxcar_sum(values, 7),
+        )
@@ -0,0 +1,35 @@
+import unittest
+
+import aspecd.processing
+import numpy as np
+
+import trepr.dataset
+import trepr.report
+
+
+class TestExperimentalDatasetLaTeXReporter(unittest.TestCase):
+    def setUp(self):
+        self.reporter = trepr.report.ExperimentalDatasetLaTeXReporter()
+        self.dataset = trepr.dataset.ExperimentalDataset()
+        self.dataset.data.data = np.ones(5)
+        processing_step = aspecd.processing.ScalarAlgebra()
+        processing_step.parameters["kind"] = "add"
+        processing_step.parameters["value"] = 1
+        self.dataset.process(processing_step)
+        self.processing = self.dataset.history[-1].processing
+        self.processing.parameters["nested_thing"] = {"inner_key": 1}
+        self.reporter.dataset = self.dataset
+
+    def test_get_processing_steps_leaves_history_parameters_unchanged(self):
+        self.reporter._get_processing_steps()
+        self.assertEqual(
+            {"inner_key": 1}, self.processing.parameters["nested_thing"]
+        )
+        self.assertNotIn("Nested thing", self.processing.parameters)
+
+    def test_get_processing_steps_replaces_underscores_in_keys(self):
+        self.reporter._get_processing_steps()
+        parameters = self.reporter._processing_steps[
+            self.processing.description.replace("_", " ").capitalize()
+        ]
+        self.assertEqual({"Inner key": 1}, parameters["Nested thing"])
@@ -1109,17 +1109,9 @@ class TransientNutationFFT(aspecd.analysis.SingleAnalysisStep):
         else:
             window_name = self.parameters["window"]
 
-        if self.dataset.data.data.ndim > 1:
-            for idx, row in enumerate(self._y):
-                window = windows.get_window(window_name, len(row) * 2)[
-                    len(row) :
-                ]
-                self._y[idx, :] *= window
-        else:
-            window = windows.get_window(window_name, len(self._y) * 2)[
-                len(self._y) :
-            ]
-            self._y *= window
+        n_points = self._y.shape[-1]
+        window = windows.get_window(window_name, n_points * 2)[n_points:]
+        self._y *= window
 
     def _perform_fft(self):
         self._xt = rfftfreq(
@@ -82,8 +82,8 @@ Module documentation
 
 """
 
-import collections
 import datetime
+import functools
 import glob
 import io
 import logging
@@ -107,6 +107,35 @@ logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
 
+@functools.lru_cache(maxsize=None)
+def _read_package_yaml(filename):
+    """
+    Read YAML file contained in the package data and return its contents.
+
+    Mapping files contained in the package data do not change, but are
+    needed for every dataset imported. Hence, each file is parsed only once.
+
+    .. note::
+        The returned dict is shared between all callers and must not be
+        modified.
+
+    Parameters
+    ----------
+    filename : :class:`str`
+        Name of the file in the package data, prefixed by the package
+        name, such as ``trepr@tez_mapper.yaml``
+
+    Returns
+    -------
+    contents : :class:`dict`
+        Contents of the YAML file
+
+    """
+    yaml_file = aspecd.utils.Yaml()
+    yaml_file.read_stream(aspecd.utils.get_package_data(filename).encode())
+    return yaml_file.dict
+
+
 class DatasetImporterFactory(aspecd.io.DatasetImporterFactory):
     """Factory for creating importer objects based on the source provided.
 
@@ -535,7 +564,7 @@ class TezImporter(aspecd.io.DatasetImporter):
         shape.reverse()  # Shape is given in reverse order in .dim file
         raw_data = np.fromfile(self._raw_data_name, dtype="<f8")
         raw_data = np.reshape(raw_data, shape).transpose()
-        self.dataset.data.data = raw_data
+        self.dataset.data.data = np.ascontiguousarray(raw_data)
 
     def _parse_axes(self):
         if len(self.xml_dict["struct"]["axes"]["data"]["measure"]) > 3:
@@ -631,13 +660,10 @@ class TezImporter(aspecd.io.DatasetImporter):
         return values
 
     def _get_metadata_from_xml(self):
-        mapping = aspecd.utils.Yaml()
-        mapping.read_stream(
-            aspecd.utils.get_package_data(self.tez_mapper_filename).encode()
-        )
-        metadata_dict = collections.OrderedDict()
-        for key, subdict in mapping.dict.items():
-            metadata_dict[key] = collections.OrderedDict()
+        mapping = _read_package_yaml(self.tez_mapper_filename)
+        metadata_dict = {}
+        for key, subdict in mapping.items():
+            metadata_dict[key] = {}
             for key2, value in subdict.items():
                 metadata_dict[key][key2] = self._cascade(
                     self.xml_dict["struct"], value
@@ -1106,14 +1132,9 @@ class BES3TImporter(aspecd.io.DatasetImporter):
                 self._dsc_keys[key] = value
 
     def _map_dsc_file(self):
-        yaml_file = aspecd.utils.Yaml()
-        yaml_file.read_stream(
-            aspecd.utils.get_package_data(
-                "trepr@" + self._mapper_filename
-            ).encode()
-        )
+        mapping = _read_package_yaml("trepr@" + self._mapper_filename)
         metadata_dict = {}
-        metadata_dict = self._traverse(yaml_file.dict, metadata_dict)
+        metadata_dict = self._traverse(mapping, metadata_dict)
         self.dataset.metadata.from_dict(metadata_dict)
         self.dataset.label = self._dsc_keys["TITL"]
 
@@ -1136,13 +1157,12 @@ class BES3TImporter(aspecd.io.DatasetImporter):
             "D": "d",
         }
         dtype = byte_order + format_[self._dsc_keys["IRFMT"]]
-        self.dataset.data.data = np.fromfile(filename, dtype=dtype)
+        data = np.fromfile(filename, dtype=dtype)
         if "YPTS" in self._dsc_keys and self._dsc_keys["YPTS"]:
-            self.dataset.data.data = np.reshape(
-                self.dataset.data.data, (-1, self._dsc_keys["XPTS"])
-            ).T
+            data = np.reshape(data, (-1, self._dsc_keys["XPTS"])).T
         if self._dsc_keys["XNAM"].lower() == "time":
-            self.dataset.data.data = self.dataset.data.data.T
+            data = data.T
+        self.dataset.data.data = np.ascontiguousarray(data)
 
     def _assign_axes(self):
         yaxis = None
@@ -178,10 +178,8 @@ class ColormapAdjuster:
         self._set_norm()
 
     def _get_min_and_max(self):
-        """Calculate the minimum an maximum of the intensity."""
-        min_ = np.amin(self.dataset.data.data)
-        max_ = np.amax(self.dataset.data.data)
-        self._bound = np.amax([abs(min_), max_])
+        """Calculate the maximum absolute value of the intensity."""
+        self._bound = np.amax(np.abs(self.dataset.data.data))
 
     def _set_norm(self):
         """Normalize the colormap."""
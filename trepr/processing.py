@@ -186,20 +186,15 @@ class PretriggerOffsetCompensation(aspecd.processing.SingleProcessingStep):
 
     def _get_zeropoint_index(self):
         """Get the index of the last time value before the trigger."""
-        zeropoint_index = np.argmin(abs(self.dataset.data.axes[1].values))
+        zeropoint_index = np.argmin(np.abs(self.dataset.data.axes[1].values))
         self.parameters["zeropoint_index"] = int(zeropoint_index)
 
     def _execute_compensation(self, range_end):
         """Execute the pretrigger offset compensation."""
-        for field_point, time_trace in enumerate(self.dataset.data.data):
-            pretrig_avg = self._get_pretrigger_average(time_trace, range_end)
-            self.dataset.data.data[field_point] = time_trace - pretrig_avg
-
-    @staticmethod
-    def _get_pretrigger_average(time_trace, range_end=1):
-        """Calculate the average of the time trace before triggering."""
-        array = time_trace[0:range_end]
-        return np.average(array)
+        data = self.dataset.data.data
+        if not np.issubdtype(data.dtype, np.inexact):
+            data = self.dataset.data.data = data.astype(float)
+        data -= np.mean(data[:, :range_end], axis=1, keepdims=True)
 
 
 class BackgroundCorrection(aspecd.processing.SingleProcessingStep):
@@ -318,14 +313,12 @@ class BackgroundCorrection(aspecd.processing.SingleProcessingStep):
         return len(dataset.data.axes) == 3
 
     def _sanitise_parameters(self):
-        if not isinstance(self.parameters["num_profiles"], list):
-            self.parameters["num_profiles"] = [
-                self.parameters["num_profiles"]
-            ]
-        if len(self.parameters["num_profiles"]) == 1:
-            self.parameters["num_profiles"] = self.parameters["num_profiles"][
-                0
-            ]
+        num_profiles = self.parameters["num_profiles"]
+        if not isinstance(num_profiles, list):
+            num_profiles = [num_profiles]
+        if len(num_profiles) == 1:
+            num_profiles = num_profiles[0]
+        self.parameters["num_profiles"] = num_profiles
 
     def _set_defaults(self):
         self.parameters["num_profiles"] = self.parameters["num_profiles"] or [
@@ -338,10 +331,9 @@ class BackgroundCorrection(aspecd.processing.SingleProcessingStep):
         self._subtract_background()
 
     def _check_data_size(self):
-        if isinstance(self.parameters["num_profiles"], list):
-            num_profiles = sum(self.parameters["num_profiles"])
-        else:
-            num_profiles = self.parameters["num_profiles"]
+        num_profiles = self.parameters["num_profiles"]
+        if isinstance(num_profiles, list):
+            num_profiles = sum(num_profiles)
         if len(self.dataset.data.axes[0].values) <= 2 * num_profiles:
             raise aspecd.exceptions.NotApplicableToDatasetError(
                 message="The given dataset ist too small to perform "
@@ -349,44 +341,39 @@ class BackgroundCorrection(aspecd.processing.SingleProcessingStep):
             )
 
     def _subtract_background(self):
-        if (
-            isinstance(self.parameters["num_profiles"], list)
-            and len(self.parameters["num_profiles"]) == 2
-        ):
+        num_profiles = self.parameters["num_profiles"]
+        if isinstance(num_profiles, list) and len(num_profiles) == 2:
             self._bg_corr_with_slope()
         else:
             self._bg_corr_one_side()
 
     def _bg_corr_with_slope(self):
-        low = self.parameters["num_profiles"][0]
-        high = abs(self.parameters["num_profiles"][1])
-        lower_mean = np.mean(self.dataset.data.data[:low, :], axis=0)
-        higher_mean = np.mean(self.dataset.data.data[-high:, :], axis=0)
-        slope = (higher_mean - lower_mean) / self.dataset.data.data.shape[0]
-        for idx, transient in enumerate(self.dataset.data.data):
-            transient -= lower_mean + slope * idx
+        low, high = self.parameters["num_profiles"]
+        data = self.dataset.data.data
+        lower_mean = np.mean(data[:low, :], axis=0)
+        higher_mean = np.mean(data[-abs(high) :, :], axis=0)
+        slope = (higher_mean - lower_mean) / data.shape[0]
+        indices = np.arange(data.shape[0], dtype=data.dtype)[:, np.newaxis]
+        data -= lower_mean + slope * indices
 
     def _bg_corr_one_side(self):
-        assert isinstance(self.parameters["num_profiles"], int)
+        num_profiles = self.parameters["num_profiles"]
+        assert isinstance(num_profiles, int)
 
-        if self.parameters["num_profiles"] < 0:
+        if num_profiles < 0:
             self._subtract_from_end()
         else:
             self._subtract_from_begin()
 
     def _subtract_from_end(self):
-        bg = np.mean(
-            self.dataset.data.data[self.parameters["num_profiles"] :, :],
-            axis=0,
-        )
-        self.dataset.data.data -= bg
+        data = self.dataset.data.data
+        num_profiles = abs(self.parameters["num_profiles"])
+        data -= np.mean(data[-num_profiles:, :], axis=0)
 
     def _subtract_from_begin(self):
-        bg = np.mean(
-            self.dataset.data.data[: self.parameters["num_profiles"], :],
-            axis=0,
-        )
-        self.dataset.data.data -= bg
+        data = self.dataset.data.data
+        num_profiles = self.parameters["num_profiles"]
+        data -= np.mean(data[:num_profiles, :], axis=0)
 
 
 class FrequencyCorrection(aspecd.processing.SingleProcessingStep):
@@ -660,8 +647,8 @@ class TriggerAutodetection(aspecd.processing.SingleProcessingStep):
             time_trace = self.dataset.data.data[0, :]
         else:
             time_trace = self.dataset.data.data
-        smoothed_differences = np.convolve(
-            np.diff(time_trace), np.ones(int(len(time_trace) / 20))
+        smoothed_differences = self._boxcar_sum(
+            np.diff(time_trace), int(len(time_trace) / 20)
         )
         try:
             threshold = (
@@ -675,3 +662,21 @@ class TriggerAutodetection(aspecd.processing.SingleProcessingStep):
         for axis in self.dataset.data.axes:
             if "time" in axis.quantity:
                 axis.values -= axis.values[trigger_pos]
+
+    @staticmethod
+    def _boxcar_sum(values, window_length):
+        """
+        Sum values within a sliding window of given length.
+
+        The result is identical to a full convolution with a boxcar window
+        (``np.convolve(values, np.ones(window_length))``), but is obtained
+        from a cumulative sum. Hence, the cost does not depend on the window
+        length, which scales with the length of the time trace.
+        """
+        cumulative_sum = np.cumsum(values)
+        cumulative_sum = np.concatenate(
+            (cumulative_sum, np.full(window_length - 1, cumulative_sum[-1]))
+        )
+        boxcar_sum = cumulative_sum.copy()
+        boxcar_sum[window_length:] -= cumulative_sum[:-window_length]
+        return boxcar_sum
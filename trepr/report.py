@@ -49,15 +49,30 @@ Module documentation
 
 """
 
-import collections
+import functools
 import time
 
-import jinja2
-
 import aspecd.report
 import trepr.dataset
 
 
+_FIGURE_NAMES = {
+    "2D plot as scaled image.": "Figure2D",
+    "1D line plot.": "Figure1D",
+}
+_UNDERSCORE_TO_SPACE = str.maketrans("_", " ")
+
+
+@functools.lru_cache(maxsize=4096)
+def _latexify_key(key):
+    """Replace underscores with spaces and capitalise key for LaTeX output.
+
+    The same metadata and parameter keys occur in every report, hence the
+    results are cached.
+    """
+    return key.translate(_UNDERSCORE_TO_SPACE).capitalize()
+
+
 class ExperimentalDatasetLaTeXReporter(aspecd.report.LaTeXReporter):
     """
     Generate a report based on a LaTeX template provided.
@@ -97,10 +112,9 @@ class ExperimentalDatasetLaTeXReporter(aspecd.report.LaTeXReporter):
         super().__init__(template=template, filename=filename)
         self.dataset = trepr.dataset.Dataset()
         # protected properties
-        self._latex_jinja_env = jinja2.Environment()
         self._metadata = {}
         self._date = None
-        self._processing_steps = collections.OrderedDict()
+        self._processing_steps = {}
         self._avg_parameter = {}
         self._figure_name = {}
 
@@ -115,26 +129,25 @@ class ExperimentalDatasetLaTeXReporter(aspecd.report.LaTeXReporter):
 
     def _prepare_metadata(self):
         """Prepare the metadata the way it can be rendered automatically."""
-        self._metadata = self.dataset.metadata.to_dict()
-        self._metadata = self._change_keys_in_dict_recursively(self._metadata)
-        self._metadata["Parameter"] = collections.OrderedDict()
-        self._collect_parameters()
-
-    def _collect_parameters(self):
-        """Collect all the metadata keys."""
-        for key in self._metadata.keys():
-            if key not in ["Sample", "Measurement", "Parameter"]:
-                self._metadata["Parameter"][key] = self._metadata[key]
+        self._metadata = self._change_keys_in_dict_recursively(
+            self.dataset.metadata.to_dict()
+        )
+        self._metadata["Parameter"] = {
+            key: value
+            for key, value in self._metadata.items()
+            if key not in ["Sample", "Measurement", "Parameter"]
+        }
 
     def _get_processing_steps(self):
         """Get processing steps from history."""
-        for history_record in self.dataset.history:
-            self._processing_steps[history_record.processing.description] = (
-                history_record.processing.parameters
+        self._processing_steps = {
+            _latexify_key(history_record.processing.description): (
+                self._change_keys_in_dict_recursively(
+                    history_record.processing.parameters
+                )
             )
-        self._processing_steps = self._change_keys_in_dict_recursively(
-            self._processing_steps
-        )
+            for history_record in self.dataset.history
+        }
 
     def _change_keys_in_dict_recursively(self, dict_=None):
         """Replace all underscores in the keys with a space.
@@ -142,22 +155,22 @@ class ExperimentalDatasetLaTeXReporter(aspecd.report.LaTeXReporter):
         Note: This is done because LaTeX interprets the underscore not as
         underscore but as command for subscription.
         """
-        tmp_dict = collections.OrderedDict()
-        for key, value in dict_.items():
-            if isinstance(value, dict):
-                dict_[key] = self._change_keys_in_dict_recursively(value)
-            tmp_dict[key.replace("_", " ").capitalize()] = dict_[key]
-        return tmp_dict
+        return {
+            _latexify_key(key): (
+                self._change_keys_in_dict_recursively(value)
+                if isinstance(value, dict)
+                else value
+            )
+            for key, value in dict_.items()
+        }
 
     def _get_figure_names(self):
         """Get the names of the figures used for the report."""
         for representation in self.dataset.representations:
-            if representation.plot.description == "2D plot as scaled image.":
-                self._figure_name["Figure2D"] = representation.plot.filename
-            elif representation.plot.description == "1D line plot.":
-                self._figure_name["Figure1D"] = representation.plot.filename
-            else:
-                pass
+            plot = representation.plot
+            figure_name = _FIGURE_NAMES.get(plot.description)
+            if figure_name:
+                self._figure_name[figure_name] = plot.filename
 
     def _get_current_date(self):
         """Get the current date."""